@@ -101,9 +101,9 @@ import pickle
 import shap
 import matplotlib.pyplot as plt
 from fpdf import FPDF
-import streamlit.components.v1 as components
 import os
-import re
+import time
+import logging
 from deep_translator import GoogleTranslator
 from gtts import gTTS
 import base64
@@ -111,6 +111,15 @@ from io import BytesIO
 from db_manager import save_profile, log_health_check, get_last_checkin
 from ocr_engine import extract_biomarkers, get_health_score_boost
 from streamlit_mic_recorder import mic_recorder
+from localization import LANG_MAP
+from symptom_index import load_symptom_index
+from inference_engine import boost_vector, score_batch
+from model_registry import ModelRegistry, ShadowEvaluator
+from vision_engine import VisionEngine
+from avatar_component import avatar
+from session_store import (SessionStore, SessionRegistry, codec_for, codec_by_id, compact_chat_log,
+                           new_consult_id, restore)
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 import speech_recognition as sr
 
 # --- SPECIALIST & ANATOMICAL MAPPINGS ---
@@ -127,7 +136,31 @@ def get_specialist(disease):
     }
     return mapping.get(disease, "General Physician")
 
-def generate_pdf(bio_data, symptoms, results, lang_code, shap_summary, h_part):
+# Avatar regions voted on by a disease's most relevant symptoms
+SYMPTOM_REGIONS = {
+    "Head": ["headache", "severe headache", "blurred vision", "eye pain", "eye redness", "itchy eyes",
+             "watery eyes", "halo around lights", "loss of side vision", "pain behind the eyes",
+             "sinus pressure", "runny nose", "runny or stuffy nose", "sneezing", "sore throat",
+             "dizziness", "neck stiffness", "stiff neck", "loss of taste", "loss of smell"],
+    "Abdomen": ["belly pain", "abdominal pain", "abdominal cramps", "diarrhea", "watery stools", "vomiting",
+                "nausea", "nausea and vomiting", "bloating", "constipation", "heartburn", "acid reflux",
+                "stomach ulcer", "bloody stool", "bloody stools", "anal pain", "soreness around anus",
+                "pain during bowel movements", "loss of appetite"],
+}
+
+def get_body_region(disease):
+    if relevance is not None:
+        votes = {region: sum(relevance.lookup(disease, s)[1] for s in relevance.top_symptoms(disease, k=8) if s in members)
+                 for region, members in SYMPTOM_REGIONS.items()}
+        region = max(votes, key=votes.get)
+        if votes[region] > 0: return region
+    target = disease.lower()
+    return "Head" if any(x in target for x in ['cold', 'flu', 'migraine', 'hypertension', 'eye', 'glaucoma']) else "Abdomen"
+
+@st.cache_data(max_entries=64, ttl=900)
+def generate_pdf(bio_data, symptoms, results, titles, shap_summary, h_part):
+    # titles are translated by the caller: a translator fallback must not be cached with the PDF
+    header_text, sub_text = titles
     pdf = FPDF()
     pdf.add_page()
     
@@ -142,11 +175,9 @@ def generate_pdf(bio_data, symptoms, results, lang_code, shap_summary, h_part):
     
     # Header
     pdf.set_text_color(7, 94, 84) # WhatsApp-style Green
-    header_text = translate_dynamic("BIOPREDICT AI: UNIVERSAL DIAGNOSTIC SUMMARY", lang_code)
     pdf.cell(200, 10, txt=header_text, ln=True, align='C')
     pdf.set_font("Arial", size=10)
     pdf.set_text_color(0, 0, 0)
-    sub_text = translate_dynamic("Universal Healthcare Access Powered by BioPredict AI", lang_code)
     pdf.cell(200, 10, txt=sub_text, ln=True, align='C')
     pdf.ln(10)
     
@@ -206,6 +237,9 @@ def generate_pdf(bio_data, symptoms, results, lang_code, shap_summary, h_part):
     return bytes(pdf.output())
 
 def get_shap_summary(vec, top_disease):
+    # Training-time per-class attributions turn this into a table lookup
+    if relevance is not None:
+        return ", ".join(relevance.explain(top_disease, [s for s, v in zip(symptoms_list, vec) if v]))
     explainer = shap.TreeExplainer(model)
     shap_vals = explainer.shap_values(np.array([vec]))
     class_idx = list(le.classes_).index(top_disease)
@@ -218,20 +252,6 @@ def get_shap_summary(vec, top_disease):
 st.set_page_config(page_title="BioAI - Hyper-Localized Health Companion", layout="wide", initial_sidebar_state="expanded")
 set_design()
 
-# --- HYPER-LOCALIZATION CONFIG (30+ LANGUAGES) ---
-LANG_MAP = {
-    "English": "en", "Hindi (हिन्दी)": "hi", "Tamil (தமிழ்)": "ta", "Telugu (తెలుగు)": "te",
-    "Marathi (मराठी)": "mr", "Bengali (বাংলা)": "bn", "Gujarati (ગુજરાતી)": "gu",
-    "Kannada (ಕನ್ನಡ)": "kn", "Malayalam (മലയാളം)": "ml", "Punjabi (ਪੰਜਾਬী)": "pa",
-    "Odia (ଓଡ଼ିଆ)": "or", "Assamese (অসমীয়া)": "as", "Maithili (मैथिली)": "mai",
-    "Santali (संताली)": "sat", "Kashmiri (کٲشُر)": "ks", "Konkani (कोंकणी)": "kok",
-    "Sindhi (سنڌي)": "sd", "Dogri (डोंगरी)": "doi", "Manipuri (মণিপুরী)": "mni",
-    "Sanskrit (संस्कृतम्)": "sa", "Nepali (नेपाली)": "ne", "Urdu (اردو)": "ur",
-    "Bhojpuri (भोजपुरी)": "bho", "Haryanvi (हरियाणवी)": "bgc", "Rajasthani (राजस्थانی)": "raj",
-    "Bodo (बड़ो)": "brx", "Mizo (मिज़ो)": "lus", "Khasi (खासी)": "kha", "Garo (गारो)": "grt",
-    "Tulu (ತುಳು)": "tcy"
-}
-
 LANG_STRINGS = {
     "en": {
         "app_title": "🛡️ BioAi Health Companion",
@@ -265,7 +285,8 @@ LANG_STRINGS = {
         "final_summary_btn": "View Final Diagnostic Summary",
         "guidance_msg": "I've outlined your guidance below. You can also download a formal clinical report for your records.",
         "setup_msg": "Hello! I am your Health Companion. Let's set up your profile first.",
-        "stop_btn": "Stop"
+        "stop_btn": "Stop",
+        "earlier_msgs": "Show earlier messages"
     },
     "hi": {
         "app_title": "🛡️ बायोएआई स्वास्थ्य साथी",
@@ -356,18 +377,26 @@ def symptom_format(symptom_name, lang):
     return translate_dynamic(symptom_name, lang)
 
 @st.cache_data
+def translate_text(text, dest_lang):
+    # Raises on failure so a transient translator error is never cached
+    return GoogleTranslator(source='auto', target=dest_lang).translate(text)
+
 def translate_dynamic(text, dest_lang):
     if dest_lang == "en": return text
-    try: return GoogleTranslator(source='auto', target=dest_lang).translate(text)
+    try: return translate_text(text, dest_lang)
     except: return text
 
+@st.cache_data(max_entries=256, ttl=3600)
+def synthesize_speech(text, lang):
+    # Raises on failure so a transient gTTS/network error is never cached
+    # slow=True for medical clarity as requested
+    tts = gTTS(text=text, lang=lang, slow=True)
+    fp = BytesIO()
+    tts.write_to_fp(fp)
+    return fp.getvalue()
+
 def speak_text(text, lang):
-    try:
-        # slow=True for medical clarity as requested
-        tts = gTTS(text=text, lang=lang, slow=True)
-        fp = BytesIO()
-        tts.write_to_fp(fp)
-        return fp.getvalue()
+    try: return synthesize_speech(text, lang)
     except: return None
 
 # --- STT & RECORDING ---
@@ -404,24 +433,99 @@ st.markdown("""
 
 # --- MODELS ---
 @st.cache_resource
-def load_assets():
-    with open('models/model.pkl', 'rb') as f: model = pickle.load(f)
-    with open('models/label_encoder.pkl', 'rb') as f: le = pickle.load(f)
-    with open('models/symptoms_list.pkl', 'rb') as f: slist = pickle.load(f)
-    return model, le, slist
+def load_registry():
+    # Watches models/registry/CURRENT and hot-swaps retrained models without a restart.
+    # Reloads and shadow agreement are logged at INFO, which the root fallback handler drops
+    log = logging.getLogger("biopredict")
+    if not log.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(levelname)s %(message)s"))
+        log.addHandler(handler)
+        log.setLevel(os.environ.get("BIOPREDICT_LOG_LEVEL", "INFO"))
+    return ModelRegistry(), ShadowEvaluator()
+
+model_registry, shadow = load_registry()
+bundle = model_registry.get()
+model, le, symptoms_list, class_index = bundle.model, bundle.le, bundle.symptoms_list, bundle.class_index
+relevance = bundle.relevance
+
+@st.cache_resource
+def load_index(slist):
+    # Typo-tolerant, per-language lookup; built offline by `python symptom_index.py`
+    return load_symptom_index(slist)
+
+symptom_index = load_index(symptoms_list)
+
+@st.cache_resource
+def load_session_store():
+    store = SessionStore()
+    return store, SessionRegistry(store).start()
+
+session_store, session_registry = load_session_store()
+
+@st.cache_resource
+def load_vision_engine():
+    return VisionEngine()
 
-model, le, symptoms_list = load_assets()
+vision_engine = load_vision_engine()
+symptom_codec = codec_for(symptoms_list)
 
 # --- STATE ---
+# Claim this session before touching its state so the idle sweeper can't evict it mid-run
+ctx = get_script_run_ctx()
+if ctx: session_registry.claim(ctx.session_id, ctx.session_state, symptom_codec)
+
+# Idle sessions are evicted to the session store down to a profile_id/consult_id stub; bring them back first
+if st.session_state.get("evicted"):
+    payload = session_store.load_state(st.session_state.consult_id)
+    if payload: restore(st.session_state, payload, symptom_codec)
+    st.session_state.evicted = False
+
 if "step" not in st.session_state: st.session_state.step = 0
 if "profile_id" not in st.session_state: st.session_state.profile_id = None
-if "selected_symptoms" not in st.session_state: st.session_state.selected_symptoms = set()
+if "consult_id" not in st.session_state: st.session_state.consult_id = new_consult_id()
+if "symptom_mask" not in st.session_state: st.session_state.symptom_mask = 0
+if "spec_id" not in st.session_state: st.session_state.spec_id = symptom_codec.spec_id
 if "biomarkers" not in st.session_state: st.session_state.biomarkers = {}
 if "vision_data" not in st.session_state: st.session_state.vision_data = None
+if "camera_round" not in st.session_state: st.session_state.camera_round = 0
 if "chat_log" not in st.session_state: st.session_state.chat_log = []
+if "chat_spilled" not in st.session_state: st.session_state.chat_spilled = 0
 if "probing_count" not in st.session_state: st.session_state.probing_count = 0
 if "probing_questions" not in st.session_state: st.session_state.probing_questions = []
 
+# A hot-reloaded model may ship a different feature spec; re-encode the mask against it
+if st.session_state.spec_id != symptom_codec.spec_id:
+    old_codec = codec_by_id(st.session_state.spec_id)
+    if old_codec: st.session_state.symptom_mask = symptom_codec.encode(old_codec.decode(st.session_state.symptom_mask))
+    st.session_state.spec_id = symptom_codec.spec_id
+
+def get_symptoms():
+    return symptom_codec.decode(st.session_state.symptom_mask)
+
+def clinical_symptoms():
+    # Typed/spoken/probed symptoms plus whatever the camera vision stage detected
+    vision = st.session_state.vision_data or {}
+    symptoms = get_symptoms()
+    return symptoms + [s for s in vision.get("symptoms", []) if s not in symptoms]
+
+def add_symptoms(names):
+    st.session_state.symptom_mask |= symptom_codec.encode(names)
+
+def log_message(role, content):
+    # Keeps the last CHAT_LOG_CAP messages in memory; older ones go to the session store
+    st.session_state.chat_log.append({"role": role, "content": content})
+    st.session_state.chat_log, st.session_state.chat_spilled = compact_chat_log(
+        session_store, st.session_state.consult_id, st.session_state.chat_log, st.session_state.chat_spilled)
+
+@st.fragment(run_every=0.5)
+def await_vision(image_bytes):
+    # Only this fragment re-polls while the frame is analysed; the full rerun happens once it's done.
+    # submit() is idempotent and re-queues the frame if it fell out of the shared LRU meanwhile
+    if vision_engine.result(vision_engine.submit(image_bytes), timeout=0) is not None:
+        st.rerun()
+    st.info("Vision engine analyzing frame...")
+
 # --- SIDEBAR ---
 with st.sidebar:
     st.header(t('guardian_menu'))
@@ -441,28 +545,37 @@ with st.sidebar:
     
     st.markdown("---")
     st.header(t('camera_label'))
-    vision_img = st.camera_input("")
-    if vision_img:
-        st.session_state.vision_data = "Localized Rash Detected"
-        st.info("Vision engine mapping to avatar...")
+    # A new consultation bumps the key so the previous patient's photo is dropped with the widget
+    vision_img = st.camera_input("", key=f"vision_cam_{st.session_state.camera_round}")
+    if not vision_img:
+        st.session_state.vision_data = None
+    else:
+        # Analysed on the vision worker pool and cached by image hash, so reruns reuse the result
+        frame_bytes = vision_img.getvalue()
+        vision_result = vision_engine.result(vision_engine.submit(frame_bytes), timeout=0)
+        st.session_state.vision_data = vision_result
+        if vision_result:
+            st.info(vision_result["label"])
+        else:
+            await_vision(frame_bytes)
 
 # --- FLOW ---
 # (Hero moved to main interface section)
 
-def get_followup_question(current_symptoms, top_diseases):
+def get_followup_question(current_symptoms, top_diseases, asked=()):
     """Suggests a symptom to ask about based on high-probability diseases."""
-    candidate_symptoms = []
-    # Peek into model classes to find relevant symptoms for top diseases
-    # Simplified: pick symptoms from symptoms_list that are common in top_diseases but not yet selected
-    # In a real model, we'd use feature importance or correlation matrices
-    # For now, we'll pick some common medical probes
-    probes = ["Headache", "Fever", "Fatigue", "Nausea", "Dizziness", "Cough", "Breathlessness", "Skin Rash"]
-    for p in probes:
-        if p.lower() not in [s.lower() for s in current_symptoms]:
-            candidate_symptoms.append(p)
+    skip = {s.lower() for s in current_symptoms} | {s.lower() for s in asked}
+    if relevance is not None:
+        # Strongest indicators of the leading diseases, preferring the one that best separates them
+        candidates = [s for d in top_diseases for s in relevance.top_symptoms(d, k=5, exclude=skip)]
+        if candidates:
+            spread = lambda s: max(relevance.lookup(d, s)[0] for d in top_diseases) - min(relevance.lookup(d, s)[0] for d in top_diseases)
+            return max(candidates, key=spread)
     
+    # Older model artifacts without a relevance index: common medical probes
+    probes = ["Headache", "Fever", "Fatigue", "Nausea", "Dizziness", "Cough", "Breathlessness", "Skin Rash"]
+    candidate_symptoms = [p for p in probes if p.lower() not in skip]
     if not candidate_symptoms: return None
-    # Pick a random one for variety or just the first
     return candidate_symptoms[0]
 
 def t_jargon(disease):
@@ -476,24 +589,20 @@ def t_jargon(disease):
     desc = jargon_map.get(disease, "A complex condition affecting your health system.")
     return translate_dynamic(desc, st.session_state.lang)
 
+def batch_inference(symptom_sets, bio_data, biomarkers, k=3):
+    """Scores many hypothetical symptom sets for one profile in a single vectorized pass."""
+    X = [[1 if s in symptoms else 0 for s in symptoms_list] for symptoms in symptom_sets]
+    # Weights: Medical History + Biomarkers (OCR), folded into one boost row
+    boost = boost_vector(class_index, bio_data, get_health_score_boost(biomarkers))
+    top_idx, top_probs = score_batch(model, X, boost, k)
+    return [list(zip(le.classes_[i], p)) for i, p in zip(top_idx, top_probs)], X
+
 def unified_inference(symptoms, bio_data, biomarkers):
-    vec = [1 if s in symptoms else 0 for s in symptoms_list]
-    probs = model.predict_proba([vec])[0]
-    classes = list(le.classes_)
-    
-    # Weights: Medical History
-    if bio_data.get("history"):
-        for h in bio_data["history"]:
-            if h in classes: probs[classes.index(h)] *= 1.4
-    
-    # Weights: Biomarkers (OCR)
-    boosts = get_health_score_boost(biomarkers)
-    for disease, boost in boosts.items():
-        if disease in classes: probs[classes.index(disease)] *= boost
-        
-    probs = probs / np.sum(probs)
-    top_indices = np.argsort(probs)[-3:][::-1]
-    return list(zip(le.inverse_transform(top_indices), probs[top_indices])), vec
+    t0 = time.perf_counter()
+    results, X = batch_inference([symptoms], bio_data, biomarkers)
+    shadow.maybe_submit(model_registry.candidate(), symptoms, bio_data, get_health_score_boost(biomarkers),
+                        results[0][0][0], time.perf_counter() - t0)
+    return results[0], X[0]
 
 # (Utility functions moved below)
 
@@ -515,34 +624,8 @@ def render_voice_input():
     return None
 
 def render_3d_avatar(h_part, is_speaking=False):
-    three_js = f"""
-    <div id="scene" style="width:100%; height:300px; background:white; border-radius:20px;"></div>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/three.js/r128/three.min.js"></script>
-    <script>
-        const scene = new THREE.Scene();
-        const camera = new THREE.PerspectiveCamera(50, 1.5, 0.1, 1000);
-        const renderer = new THREE.WebGLRenderer({{antialias:true, alpha:true}});
-        renderer.setSize(450, 300);
-        document.getElementById('scene').appendChild(renderer.domElement);
-        camera.position.z = 6;
-        const mat = new THREE.MeshPhongMaterial({{color: 0x128C7E}});
-        const human = new THREE.Group(); scene.add(human);
-        human.add(new THREE.Mesh(new THREE.BoxGeometry(1.2, 2.5, 0.6), mat));
-        const head = new THREE.Mesh(new THREE.SphereGeometry(0.45), mat); head.position.y = 1.6; human.add(head);
-        if("{h_part}" === "Head") head.material = new THREE.MeshPhongMaterial({{color: 0x075E54, emissive: 0x128C7E}});
-        const l = new THREE.DirectionalLight(0xffffff, 1); l.position.set(5,5,5); scene.add(l);
-        scene.add(new THREE.AmbientLight(0x404040, 0.8));
-        (function anim() {{ 
-            requestAnimationFrame(anim); 
-            human.rotation.y += 0.005; 
-            if({str(is_speaking).lower()}) {{
-                human.scale.set(1 + Math.sin(Date.now() * 0.01) * 0.05, 1 + Math.sin(Date.now() * 0.01) * 0.05, 1);
-            }}
-            renderer.render(scene, camera); 
-        }})();
-    </script>
-    """
-    components.html(three_js, height=320)
+    # Locally served, persistent component: reruns only push h_part/is_speaking into the live scene
+    return avatar(h_part, is_speaking=is_speaking)
 
 # --- MAIN INTERFACE ---
 st.markdown('<div class="bio-card" style="text-align: center;">', unsafe_allow_html=True)
@@ -555,6 +638,11 @@ st.markdown(f"""
 st.markdown('</div>', unsafe_allow_html=True)
 
 # --- CHAT FLOW ---
+# Messages past CHAT_LOG_CAP live in the session store; only page them in on request
+if st.session_state.chat_spilled and st.checkbox(f"{t('earlier_msgs')} ({st.session_state.chat_spilled})"):
+    for msg in session_store.load_chat(st.session_state.consult_id):
+        with st.chat_message(msg["role"]): st.write(msg["content"])
+
 for msg in st.session_state.chat_log:
     with st.chat_message(msg["role"]): st.write(msg["content"])
 
@@ -573,9 +661,10 @@ if st.session_state.step == 0:
         
         if st.button(t('init_btn')):
             st.session_state.profile_id = save_profile(age, gender, ",".join(history))
+            st.session_state.bio_data = {"age": age, "gender": gender, "history": history}
             # Translate the initialization message
             init_content = translate_dynamic(f"Profile initialized. I noticed you mentioned {', '.join(history) if history else 'no previous history'}. I'm here to help.", st.session_state.lang)
-            st.session_state.chat_log.append({"role": "assistant", "content": init_content})
+            log_message("assistant", init_content)
             st.session_state.step = 1
             st.rerun()
     st.markdown('</div>', unsafe_allow_html=True)
@@ -586,26 +675,26 @@ elif st.session_state.step == 1:
     last_log = get_last_checkin(st.session_state.profile_id)
     if last_log and not st.session_state.chat_log:
         welcome_back = translate_dynamic(f"Welcome back. During our last talk, we discussed {last_log[1]}. How are you feeling today?", st.session_state.lang)
-        st.session_state.chat_log.append({"role": "assistant", "content": welcome_back})
+        log_message("assistant", welcome_back)
     
     with st.chat_message("assistant"): st.write(t('symptom_label'))
     
     desc = render_voice_input()
     if desc:
-        st.session_state.chat_log.append({"role": "user", "content": desc})
-        extracted = [s for s in symptoms_list if re.search(r'\b' + re.escape(s) + r'\b', desc.lower())]
-        st.session_state.selected_symptoms.update(extracted)
+        log_message("user", desc)
+        extracted = symptom_index.extract(desc, st.session_state.lang)
+        add_symptoms(extracted)
         st.session_state.step = 2
         st.rerun()
 
 elif st.session_state.step == 2:
-    results, vec = unified_inference(st.session_state.selected_symptoms, st.session_state.get("bio_data", {}), st.session_state.biomarkers)
+    results, vec = unified_inference(clinical_symptoms(), st.session_state.get("bio_data", {}), st.session_state.biomarkers)
     top_d = results[0][0]
     trans_top = translate_dynamic(top_d, st.session_state.lang)
     
     # Probing Phase
     if st.session_state.probing_count < 3: # 3 probes for a solid 2-4 range
-        q_symptom = get_followup_question(st.session_state.selected_symptoms, [r[0] for r in results[:2]])
+        q_symptom = get_followup_question(clinical_symptoms(), [r[0] for r in results[:2]], st.session_state.probing_questions)
         # Translate the symptom itself for the question
         trans_q = translate_dynamic(q_symptom, st.session_state.lang)
         
@@ -622,13 +711,15 @@ elif st.session_state.step == 2:
 
             col1, col2 = st.columns(2)
             if col1.button(t('yes'), key=f"yes_{st.session_state.probing_count}"):
-                st.session_state.selected_symptoms.add(q_symptom.lower())
+                add_symptoms([q_symptom.lower()])
+                st.session_state.probing_questions.append(q_symptom)
                 st.session_state.probing_count += 1
-                st.session_state.chat_log.append({"role": "user", "content": f"{t('yes')}, I have {trans_q}."})
+                log_message("user", f"{t('yes')}, I have {trans_q}.")
                 st.rerun()
             if col2.button(t('no'), key=f"no_{st.session_state.probing_count}"):
+                st.session_state.probing_questions.append(q_symptom)
                 st.session_state.probing_count += 1
-                st.session_state.chat_log.append({"role": "user", "content": f"{t('no')}, I don't have {trans_q}."})
+                log_message("user", f"{t('no')}, I don't have {trans_q}.")
                 st.rerun()
     else:
         with st.chat_message("assistant"):
@@ -640,7 +731,7 @@ elif st.session_state.step == 2:
 
 elif st.session_state.step == 3:
     st.markdown('<div class="bio-card">', unsafe_allow_html=True)
-    results, vec = unified_inference(st.session_state.selected_symptoms, st.session_state.get("bio_data", {}), st.session_state.biomarkers)
+    results, vec = unified_inference(clinical_symptoms(), st.session_state.get("bio_data", {}), st.session_state.biomarkers)
     top_d = results[0][0]
     trans_top = translate_dynamic(top_d, st.session_state.lang)
     shap_summary = get_shap_summary(vec, top_d)
@@ -656,10 +747,11 @@ elif st.session_state.step == 3:
             st.audio(audio_data, format="audio/mp3", autoplay=True)
         
         # --- 3D AVATAR (Synchronized Pulse) ---
-        target = top_d.lower()
-        h_part = "Head" if any(x in target for x in ['cold', 'flu', 'migraine', 'hypertension', 'eye', 'glaucoma']) else "Abdomen"
+        h_part = get_body_region(top_d)
         st.markdown('<div class="avatar-container">', unsafe_allow_html=True)
-        render_3d_avatar(h_part, is_speaking=True)
+        tapped = render_3d_avatar(h_part, is_speaking=True)
+        if tapped and tapped != h_part:
+            st.caption(translate_dynamic(f"You tapped the {tapped.lower()} region.", st.session_state.lang))
         st.markdown('</div>', unsafe_allow_html=True)
         
         st.write(t('guidance_msg'))
@@ -670,10 +762,12 @@ elif st.session_state.step == 3:
                 st.info(f"**Simple Terms:** {t_jargon(top_d)}")
             
             # --- PROFESSIONAL PDF DOWNLOAD ---
+            pdf_titles = (translate_dynamic("BIOPREDICT AI: UNIVERSAL DIAGNOSTIC SUMMARY", st.session_state.lang),
+                          translate_dynamic("Universal Healthcare Access Powered by BioPredict AI", st.session_state.lang))
             pdf_bytes = generate_pdf(st.session_state.get("bio_data", {}), 
-                                     st.session_state.selected_symptoms, 
+                                     clinical_symptoms(), 
                                      results, 
-                                     st.session_state.lang,
+                                     pdf_titles,
                                      shap_summary,
                                      h_part)
             st.download_button(label=t('download_report'), 
@@ -689,13 +783,23 @@ elif st.session_state.step == 3:
             st.write(t('checklist_item_3'))
 
         if st.button(t('new_consult_btn')):
-            log_health_check(st.session_state.profile_id, st.session_state.selected_symptoms, trans_top)
+            log_health_check(st.session_state.profile_id, clinical_symptoms(), trans_top)
+            # The archived chat and any evicted snapshot belong to the finished consultation only
+            session_store.discard(st.session_state.consult_id)
+            st.session_state.consult_id = new_consult_id()
             st.session_state.step = 0
-            st.session_state.selected_symptoms = set()
+            st.session_state.symptom_mask = 0
             st.session_state.chat_log = []
+            st.session_state.chat_spilled = 0
             st.session_state.probing_count = 0
+            st.session_state.probing_questions = []
+            st.session_state.vision_data = None
+            st.session_state.camera_round += 1
             st.rerun()
     st.markdown('</div>', unsafe_allow_html=True)
 
+# Long runs (PDF, TTS) end with a fresh activity mark
+if ctx: session_registry.claim(ctx.session_id, ctx.session_state, symptom_codec)
+
 st.markdown("---")
 st.caption("AI Health Companion | Built for Global Accessibility | 30+ Languages | Senior Health-Tech UX")
@@ -0,0 +1,24 @@
+import logging
+import os
+import streamlit as st
+import streamlit.components.v1 as components
+
+logger = logging.getLogger(__name__)
+
+_FRONTEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend")
+_THREE_BUNDLE = os.path.join(_FRONTEND_DIR, "three.min.js")
+_MISSING_BUNDLE = "3D avatar unavailable: frontend/three.min.js is missing. Restore it with `python -m avatar_component.vendor_three`."
+
+if not os.path.exists(_THREE_BUNDLE):
+    logger.warning(_MISSING_BUNDLE)
+
+# Static component: the iframe, three.js bundle and WebGL scene are created once per session
+# and survive reruns; each rerun only posts new props into the running scene.
+_avatar = components.declare_component("bio_avatar", path=_FRONTEND_DIR)
+
+def avatar(h_part, is_speaking=False, height=320, key="bio_avatar"):
+    """Renders the 3D avatar and returns the body region the patient last clicked, if any."""
+    if not os.path.exists(_THREE_BUNDLE):
+        st.warning(_MISSING_BUNDLE)
+        return None
+    return _avatar(h_part=h_part, is_speaking=is_speaking, height=height, key=key, default=None)
@@ -0,0 +1,69 @@
+// Minimal Streamlit component protocol (no build step / npm bundle needed)
+function sendMessage(type, data) {
+    window.parent.postMessage(Object.assign({ isStreamlitMessage: true, type: type }, data), "*");
+}
+
+const BASE_COLOR = 0x128C7E;
+const HIGHLIGHT = { color: 0x075E54, emissive: 0x128C7E };
+
+// --- SCENE (built once per iframe, kept across reruns) ---
+const container = document.getElementById("scene");
+const scene = new THREE.Scene();
+const camera = new THREE.PerspectiveCamera(50, 1.5, 0.1, 1000);
+const renderer = new THREE.WebGLRenderer({ antialias: true, alpha: true });
+container.appendChild(renderer.domElement);
+camera.position.z = 6;
+
+const baseMat = new THREE.MeshPhongMaterial({ color: BASE_COLOR });
+const highlightMat = new THREE.MeshPhongMaterial(HIGHLIGHT);
+const human = new THREE.Group(); scene.add(human);
+const body = new THREE.Mesh(new THREE.BoxGeometry(1.2, 2.5, 0.6), baseMat); body.name = "Abdomen"; human.add(body);
+const head = new THREE.Mesh(new THREE.SphereGeometry(0.45, 32, 16), baseMat); head.position.y = 1.6; head.name = "Head"; human.add(head);
+const light = new THREE.DirectionalLight(0xffffff, 1); light.position.set(5, 5, 5); scene.add(light);
+scene.add(new THREE.AmbientLight(0x404040, 0.8));
+
+let state = { h_part: null, is_speaking: false };
+
+function resize() {
+    const width = container.clientWidth || 450;
+    renderer.setSize(width, 300);
+    camera.aspect = width / 300;
+    camera.updateProjectionMatrix();
+}
+window.addEventListener("resize", resize);
+resize();
+
+(function anim() {
+    requestAnimationFrame(anim);
+    human.rotation.y += 0.005;
+    const pulse = state.is_speaking ? 1 + Math.sin(Date.now() * 0.01) * 0.05 : 1;
+    human.scale.set(pulse, pulse, 1);
+    renderer.render(scene, camera);
+})();
+
+// --- PYTHON -> JS: props update the running scene ---
+function onRender(args) {
+    state = { h_part: args.h_part, is_speaking: !!args.is_speaking };
+    head.material = state.h_part === "Head" ? highlightMat : baseMat;
+    body.material = state.h_part === "Abdomen" ? highlightMat : baseMat;
+    sendMessage("streamlit:setFrameHeight", { height: args.height || 320 });
+}
+
+window.addEventListener("message", function (event) {
+    if (event.data && event.data.type === "streamlit:render") onRender(event.data.args);
+});
+
+// --- JS -> PYTHON: report which region the patient tapped ---
+const raycaster = new THREE.Raycaster();
+renderer.domElement.addEventListener("click", function (event) {
+    const rect = renderer.domElement.getBoundingClientRect();
+    const pointer = new THREE.Vector2(
+        ((event.clientX - rect.left) / rect.width) * 2 - 1,
+        -((event.clientY - rect.top) / rect.height) * 2 + 1
+    );
+    raycaster.setFromCamera(pointer, camera);
+    const hit = raycaster.intersectObjects(human.children)[0];
+    if (hit) sendMessage("streamlit:setComponentValue", { value: hit.object.name, dataType: "json" });
+});
+
+sendMessage("streamlit:componentReady", { apiVersion: 1 });
@@ -0,0 +1,46 @@
+"""Re-vendors the pinned three.js bundle into the avatar component's frontend.
+
+frontend/three.min.js is committed, so the avatar renders with no CDN access.
+It is the standalone UMD build of three.js r97 that pythreejs ships, taken from
+PyPI (files.pythonhosted.org) because that mirror is reachable wherever pip is.
+Both the wheel and the extracted bundle are checked against pinned SHA-256
+digests; run with --check to verify the committed file without downloading:
+    python -m avatar_component.vendor_three [--check]
+"""
+import io
+import os
+import sys
+import hashlib
+import zipfile
+from urllib.request import urlopen
+
+THREE_REVISION = "97"
+WHEEL_URL = ("https://files.pythonhosted.org/packages/d8/8b/e2bbeb42068f0c48899e8eddd34902afc0f7429d4d2a152d2dc2670dc661/"
+             "pythreejs-2.4.2-py3-none-any.whl")
+WHEEL_SHA256 = "8418807163ad91f4df53b58c4e991b26214852a1236f28f1afeaadf99d095818"
+WHEEL_MEMBER = "pythreejs/static/three.js"
+THREE_SHA256 = "3ed7c9316c0724813330f2720111f295827ac22a04da471f167c0fa06b9f28e5"
+TARGET = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend", "three.min.js")
+
+def sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+def verify(data, expected, what):
+    digest = sha256(data)
+    if digest != expected: raise ValueError(f"{what} SHA-256 mismatch: got {digest}, pinned {expected}")
+
+def fetch():
+    with urlopen(WHEEL_URL) as resp: wheel = resp.read()
+    verify(wheel, WHEEL_SHA256, "pythreejs wheel")
+    data = zipfile.ZipFile(io.BytesIO(wheel)).read(WHEEL_MEMBER)
+    verify(data, THREE_SHA256, "three.js bundle")
+    return data
+
+if __name__ == "__main__":
+    if "--check" in sys.argv:
+        with open(TARGET, 'rb') as f: verify(f.read(), THREE_SHA256, TARGET)
+        print(f"{TARGET} matches pinned three.js r{THREE_REVISION}")
+    else:
+        data = fetch()
+        with open(TARGET, 'wb') as f: f.write(data)
+        print(f"Saved three.js r{THREE_REVISION} ({len(data) // 1024} KiB) to {TARGET}")
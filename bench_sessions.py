@@ -0,0 +1,68 @@
+"""Memory benchmark: N simulated Streamlit sessions, legacy vs compact vs evicted state.
+
+Usage: python bench_sessions.py [N]
+"""
+import os
+import sys
+import random
+import tempfile
+import time
+import tracemalloc
+
+from train import SYMPTOMS_LIST
+from session_store import SessionStore, SessionRegistry, codec_for, compact_chat_log
+
+CHAT_TURNS = 60  # long-lived consultation with voice transcripts and probing answers
+
+def fake_chat(rng):
+    return [{"role": rng.choice(["user", "assistant"]),
+             "content": " ".join(rng.choices(SYMPTOMS_LIST, k=12)) + f" ({i})"}
+            for i in range(CHAT_TURNS)]
+
+def legacy_session(rng, pid):
+    return {"step": 2, "profile_id": pid, "lang": "en",
+            "selected_symptoms": set(rng.sample(SYMPTOMS_LIST, 8)),
+            "biomarkers": {"glucose": 142.0, "hba1c": 6.9},
+            "vision_data": None, "chat_log": fake_chat(rng),
+            "probing_count": 2, "probing_questions": []}
+
+def compact_session(rng, pid, store, codec):
+    chat_log, spilled = compact_chat_log(store, str(pid), fake_chat(rng), 0)
+    return {"step": 2, "profile_id": pid, "consult_id": str(pid), "lang": "en",
+            "symptom_mask": codec.encode(rng.sample(SYMPTOMS_LIST, 8)),
+            "biomarkers": {"glucose": 142.0, "hba1c": 6.9},
+            "vision_data": None, "chat_log": chat_log, "chat_spilled": spilled,
+            "probing_count": 2, "probing_questions": []}
+
+def main(n):
+    codec = codec_for(SYMPTOMS_LIST)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SessionStore(os.path.join(tmp, "bench_sessions.db"))
+        tracemalloc.start()
+
+        rng = random.Random(0)
+        m0 = tracemalloc.get_traced_memory()[0]
+        sessions = [legacy_session(rng, i) for i in range(n)]
+        legacy = tracemalloc.get_traced_memory()[0] - m0
+        del sessions
+
+        rng = random.Random(0)
+        m0 = tracemalloc.get_traced_memory()[0]
+        sessions = [compact_session(rng, i, store, codec) for i in range(n)]
+        compact = tracemalloc.get_traced_memory()[0] - m0
+
+        registry = SessionRegistry(store, idle_timeout=0)
+        for i, state in enumerate(sessions):
+            registry.claim(i, state, codec)
+        evicted = registry.sweep(now=time.time() + 1)
+        # What remains is the profile_id/consult_id stub each evicted session keeps
+        stubs = tracemalloc.get_traced_memory()[0] - m0
+        tracemalloc.stop()
+
+    print(f"{n} sessions, {CHAT_TURNS} chat turns each")
+    print(f"  legacy  (set + full chat_log):  {legacy / 1024:10.1f} KiB  ({legacy / n:7.0f} B/session)")
+    print(f"  compact (bitmask + capped log): {compact / 1024:10.1f} KiB  ({compact / n:7.0f} B/session)")
+    print(f"  evicted ({evicted} idle stubs):      {stubs / 1024:10.1f} KiB  ({stubs / n:7.0f} B/session)")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
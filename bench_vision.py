@@ -0,0 +1,52 @@
+"""Per-frame latency benchmark for the camera vision stage: cold analysis vs cached rerun.
+
+Usage: python bench_vision.py [FRAMES]
+"""
+import sys
+import time
+from collections import Counter
+
+import cv2
+import numpy as np
+
+from vision_engine import VisionEngine, analyze_frame
+
+def synthetic_frame(rng, width=1280, height=720):
+    # Skin-toned frame with a cluster of inflamed spots, JPEG-encoded like st.camera_input output
+    img = np.full((height, width, 3), (120, 150, 200), np.uint8)
+    img = cv2.add(img, rng.integers(0, 12, img.shape, dtype=np.uint8))
+    for _ in range(rng.integers(0, 60)):
+        center = (int(rng.integers(200, width - 200)), int(rng.integers(150, height - 150)))
+        cv2.circle(img, center, int(rng.integers(8, 30)), (80, 80, 205), -1)
+    return cv2.imencode('.jpg', img)[1].tobytes()
+
+def percentiles(samples):
+    ms = np.array(samples) * 1000
+    return f"p50 {np.percentile(ms, 50):7.2f} ms  p95 {np.percentile(ms, 95):7.2f} ms"
+
+def main(n):
+    rng = np.random.default_rng(0)
+    frames = [synthetic_frame(rng) for _ in range(n)]
+
+    cold, labels = [], Counter()
+    for f in frames:
+        t0 = time.perf_counter()
+        result = analyze_frame(f)
+        cold.append(time.perf_counter() - t0)
+        labels[result['label']] += 1
+
+    engine = VisionEngine()
+    keys = [engine.submit(f) for f in frames]
+    for k in keys: engine.result(k)
+    cached = []
+    for f in frames:
+        t0 = time.perf_counter()
+        engine.result(engine.submit(f))
+        cached.append(time.perf_counter() - t0)
+
+    print(f"{n} frames of 1280x720 JPEG: {dict(labels)}")
+    print(f"  cold (decode + downscale + analysis): {percentiles(cold)}")
+    print(f"  cached rerun (hash + lookup):         {percentiles(cached)}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
@@ -0,0 +1,47 @@
+import numpy as np
+
+HISTORY_BOOST = 1.4
+
+def build_class_index(classes):
+    """Disease name -> column in predict_proba output; built once per model."""
+    return {c: i for i, c in enumerate(classes)}
+
+def boost_vector(class_index, bio_data=None, biomarker_boosts=None, extra_boosts=None):
+    """Folds every profile prior into one per-class multiplier row.
+
+    History gets a flat HISTORY_BOOST; biomarker boosts come from
+    ocr_engine.get_health_score_boost; extra_boosts takes any other
+    {disease: multiplier} prior (e.g. age/gender) in the same shape.
+    """
+    boost = np.ones(len(class_index))
+    for h in (bio_data or {}).get("history") or []:
+        i = class_index.get(h)
+        if i is not None: boost[i] *= HISTORY_BOOST
+    for priors in (biomarker_boosts, extra_boosts):
+        for disease, b in (priors or {}).items():
+            i = class_index.get(disease)
+            if i is not None: boost[i] *= b
+    return boost
+
+def adjust_posteriors(probs, boosts):
+    """Applies boosts to a (n, C) probability batch and renormalizes each row.
+
+    boosts is either one (C,) row shared by the batch or an (n, C) matrix.
+    Rows whose mass is zeroed out are returned unnormalized instead of NaN.
+    """
+    adjusted = np.asarray(probs, dtype=float) * boosts
+    totals = adjusted.sum(axis=1, keepdims=True)
+    return np.divide(adjusted, totals, out=adjusted, where=totals > 0)
+
+def top_k(probs, k=3):
+    """Top-k column indices and values per row, highest first, via argpartition."""
+    k = min(k, probs.shape[1])
+    part = np.argpartition(probs, -k, axis=1)[:, -k:]
+    part_vals = np.take_along_axis(probs, part, axis=1)
+    order = np.argsort(-part_vals, axis=1)
+    return np.take_along_axis(part, order, axis=1), np.take_along_axis(part_vals, order, axis=1)
+
+def score_batch(model, X, boosts, k=3):
+    """Batch re-scoring: one predict_proba call, one vectorized boost, one top-k."""
+    probs = adjust_posteriors(model.predict_proba(np.asarray(X)), boosts)
+    return top_k(probs, k)
@@ -0,0 +1,14 @@
+# --- HYPER-LOCALIZATION CONFIG (30+ LANGUAGES) ---
+# Kept outside app.py so offline build scripts (symptom index) can share it
+LANG_MAP = {
+    "English": "en", "Hindi (हिन्दी)": "hi", "Tamil (தமிழ்)": "ta", "Telugu (తెలుగు)": "te",
+    "Marathi (मराठी)": "mr", "Bengali (বাংলা)": "bn", "Gujarati (ગુજરાતી)": "gu",
+    "Kannada (ಕನ್ನಡ)": "kn", "Malayalam (മലയാളം)": "ml", "Punjabi (ਪੰਜਾਬী)": "pa",
+    "Odia (ଓଡ଼ିଆ)": "or", "Assamese (অসমীয়া)": "as", "Maithili (मैथिली)": "mai",
+    "Santali (संताली)": "sat", "Kashmiri (کٲشُر)": "ks", "Konkani (कोंकणी)": "kok",
+    "Sindhi (سنڌي)": "sd", "Dogri (डोंगरी)": "doi", "Manipuri (মণিপুরী)": "mni",
+    "Sanskrit (संस्कृतम्)": "sa", "Nepali (नेपाली)": "ne", "Urdu (اردو)": "ur",
+    "Bhojpuri (भोजपुरी)": "bho", "Haryanvi (हरियाणवी)": "bgc", "Rajasthani (राजस्थانی)": "raj",
+    "Bodo (बड़ो)": "brx", "Mizo (मिज़ो)": "lus", "Khasi (खासी)": "kha", "Garo (गारो)": "grt",
+    "Tulu (ತುಳು)": "tcy"
+}
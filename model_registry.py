@@ -0,0 +1,223 @@
+import os
+import json
+import time
+import pickle
+import random
+import shutil
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from inference_engine import build_class_index, boost_vector, score_batch
+from relevance_index import SymptomRelevance
+
+REGISTRY_DIR = 'models/registry'
+CURRENT = 'CURRENT'        # pointer file naming the live version
+CANDIDATE = 'CANDIDATE'    # pointer file naming the shadow-evaluated version
+LEGACY_ARTIFACTS = ('model', 'label_encoder', 'symptoms_list', 'relevance')
+POLL_INTERVAL = float(os.environ.get("BIOPREDICT_REGISTRY_POLL", 5))
+SHADOW_RATE = float(os.environ.get("BIOPREDICT_SHADOW_RATE", 0))
+KEEP_VERSIONS = int(os.environ.get("BIOPREDICT_KEEP_VERSIONS", 5))
+SHADOW_STATS = 'shadow_stats.json'  # running agreement/latency, written into the candidate's version directory
+
+log = logging.getLogger("biopredict.registry")
+
+# --- VERSIONED ARTIFACTS ---
+class ModelBundle:
+    """Everything loaded from one version directory; swapped into the app as a single reference."""
+
+    def __init__(self, version, artifacts):
+        self.version = version
+        self.artifacts = artifacts
+        self.model = artifacts['model']
+        self.le = artifacts['label_encoder']
+        self.symptoms_list = artifacts['symptoms_list']
+        self.class_index = build_class_index(self.le.classes_)
+        # Older artifacts predate the relevance matrix; callers fall back to per-request work
+        self.relevance = SymptomRelevance(artifacts['relevance']) if 'relevance' in artifacts else None
+
+def load_bundle(path, version, names=None):
+    names = names or [n[:-4] for n in os.listdir(path) if n.endswith('.pkl')]
+    artifacts = {}
+    for name in names:
+        with open(os.path.join(path, f"{name}.pkl"), 'rb') as f: artifacts[name] = pickle.load(f)
+    return ModelBundle(version, artifacts)
+
+def load_legacy_bundle():
+    # Pre-registry layout: flat models/*.pkl, which also holds the large X_train dump we skip
+    names = [n for n in LEGACY_ARTIFACTS if os.path.exists(os.path.join('models', f"{n}.pkl"))]
+    return load_bundle('models', 'legacy', names)
+
+def read_pointer(root, name):
+    try:
+        with open(os.path.join(root, name)) as f: return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+def set_pointer(root, name, version):
+    """Atomically repoints CURRENT/CANDIDATE; readers see either the old or the new version."""
+    tmp = os.path.join(root, f".{name}.tmp")
+    with open(tmp, 'w') as f:
+        f.write(version)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, os.path.join(root, name))
+
+def publish_version(artifacts, root=REGISTRY_DIR, pointer=CURRENT):
+    """Writes {name: object} pickles into a new version directory, then flips `pointer` to it."""
+    os.makedirs(root, exist_ok=True)
+    version = time.strftime('v%Y%m%d-%H%M%S')
+    while os.path.exists(os.path.join(root, version)):
+        version += '_'
+    tmp = os.path.join(root, f".tmp-{version}")
+    os.makedirs(tmp)
+    try:
+        for name, obj in artifacts.items():
+            with open(os.path.join(tmp, f"{name}.pkl"), 'wb') as f: pickle.dump(obj, f)
+        os.replace(tmp, os.path.join(root, version))
+    except Exception:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    set_pointer(root, pointer, version)
+    prune_versions(root)
+    return version
+
+def prune_versions(root=REGISTRY_DIR, keep=KEEP_VERSIONS):
+    """Deletes all but the newest `keep` version directories; CURRENT and CANDIDATE are always kept."""
+    pinned = {read_pointer(root, CURRENT), read_pointer(root, CANDIDATE)}
+    # Version names are timestamps, so name order is publish order; dot-dirs are in-flight publishes
+    versions = sorted(n for n in os.listdir(root)
+                      if not n.startswith('.') and os.path.isdir(os.path.join(root, n)))
+    removed = [v for v in versions[:-keep or None] if v not in pinned]
+    for v in removed:
+        shutil.rmtree(os.path.join(root, v), ignore_errors=True)
+    return removed
+
+# --- HOT RELOAD ---
+class ModelRegistry:
+    """Serves the CURRENT bundle and reloads it in a background thread when the pointer moves.
+
+    get() never blocks on disk: a new version is fully unpickled off the request
+    path and then swapped in with a single attribute assignment. A version that
+    fails to load is remembered and skipped until its pointer moves on.
+    """
+
+    def __init__(self, root=REGISTRY_DIR, poll_interval=POLL_INTERVAL):
+        self.root = root
+        self.poll_interval = poll_interval
+        self._failed = {}  # pointer -> version that failed to load
+        version = read_pointer(root, CURRENT)
+        self._bundle = None
+        if version:
+            try: self._bundle = self._load(version)
+            except Exception:
+                log.exception("CURRENT model %s is unreadable; booting from legacy models/", version)
+                self._failed[CURRENT] = version
+        if self._bundle is None: self._bundle = load_legacy_bundle()
+        self._candidate = None
+        self._watcher = threading.Thread(target=self._watch, name="model-registry", daemon=True)
+        self._watcher.start()
+
+    def get(self):
+        return self._bundle
+
+    def candidate(self):
+        return self._candidate
+
+    def _load(self, version):
+        return load_bundle(os.path.join(self.root, version), version)
+
+    def _refresh(self, pointer, bundle):
+        version = read_pointer(self.root, pointer)
+        if version is None: return None
+        if bundle is not None and bundle.version == version: return bundle
+        if self._failed.get(pointer) == version: return bundle
+        t0 = time.perf_counter()
+        try:
+            loaded = self._load(version)
+        except Exception:
+            # A half-published or corrupt version must never take down the live model
+            log.exception("Loading %s model %s failed; keeping %s until the pointer changes",
+                          pointer, version, bundle.version if bundle else None)
+            self._failed[pointer] = version
+            return bundle
+        self._failed.pop(pointer, None)
+        log.info("Loaded %s model %s in %.2fs", pointer, version, time.perf_counter() - t0)
+        return loaded
+
+    def _watch(self):
+        while True:
+            time.sleep(self.poll_interval)
+            try:
+                self._bundle = self._refresh(CURRENT, self._bundle) or self._bundle
+                self._candidate = self._refresh(CANDIDATE, self._candidate)
+            except Exception:
+                log.exception("Model registry poll failed")
+
+# --- SHADOW EVALUATION ---
+class ShadowEvaluator:
+    """Re-scores a sample of live consultations with the candidate model on a worker thread.
+
+    Logs per-call agreement on the top diagnosis and latency against the live
+    model, and keeps running totals per candidate version in that version's
+    SHADOW_STATS file; submissions are dropped rather than queued once
+    `max_pending` is hit.
+    """
+
+    def __init__(self, sample_rate=SHADOW_RATE, max_pending=32, root=REGISTRY_DIR):
+        self.sample_rate = sample_rate
+        self.max_pending = max_pending
+        self.root = root
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="shadow")
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._stats = {}  # candidate version -> running totals
+
+    def stats(self, version):
+        with self._lock:
+            return dict(self._stats.get(version) or {})
+
+    def maybe_submit(self, candidate, symptoms, bio_data, biomarker_boosts, live_top, live_latency):
+        if candidate is None or random.random() >= self.sample_rate: return
+        with self._lock:
+            if self._pending >= self.max_pending: return
+            self._pending += 1
+        self._pool.submit(self._score, candidate, list(symptoms), bio_data, biomarker_boosts,
+                          live_top, live_latency)
+
+    def _score(self, candidate, symptoms, bio_data, biomarker_boosts, live_top, live_latency):
+        try:
+            t0 = time.perf_counter()
+            vec = [1 if s in symptoms else 0 for s in candidate.symptoms_list]
+            boost = boost_vector(candidate.class_index, bio_data, biomarker_boosts)
+            top_idx, _ = score_batch(candidate.model, np.array([vec]), boost, k=1)
+            shadow_top = candidate.le.classes_[top_idx[0, 0]]
+            shadow_latency = time.perf_counter() - t0
+            with self._lock:
+                stats = self._stats.setdefault(candidate.version, {
+                    "calls": 0, "agreements": 0, "live_seconds": 0.0, "shadow_seconds": 0.0})
+                stats["calls"] += 1
+                stats["agreements"] += bool(shadow_top == live_top)
+                stats["live_seconds"] += live_latency
+                stats["shadow_seconds"] += shadow_latency
+                stats = dict(stats)
+            self._write_stats(candidate.version, stats)
+            log.info("shadow %s: live=%s shadow=%s agree=%s latency live=%.1fms shadow=%.1fms "
+                     "(running agreement %.1f%% over %d)", candidate.version, live_top, shadow_top,
+                     shadow_top == live_top, live_latency * 1000, shadow_latency * 1000,
+                     stats["agreements"] / stats["calls"] * 100, stats["calls"])
+        except Exception:
+            log.exception("Shadow scoring failed for %s", candidate.version)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _write_stats(self, version, stats):
+        # Only this worker thread writes; readers see the old or the new file, never a partial one
+        path = os.path.join(self.root, version, SHADOW_STATS)
+        if not os.path.isdir(os.path.dirname(path)): return  # pruned or legacy
+        tmp = os.path.join(self.root, version, f".{SHADOW_STATS}.tmp")
+        with open(tmp, 'w') as f: json.dump(dict(stats, updated=time.time()), f)
+        os.replace(tmp, path)
@@ -0,0 +1,60 @@
+import numpy as np
+
+def build_relevance(model, X, y, classes, symptoms):
+    """Training-time per-class symptom relevance: P(symptom | class) and mean SHAP attribution.
+
+    X/y are the encoded training rows; classes are the label encoder's classes_.
+    Returned as plain arrays so it pickles next to the model artifact.
+    """
+    import shap
+
+    X = np.asarray(X)
+    present = X > 0
+    shap_vals = shap.TreeExplainer(model).shap_values(X)
+    # Older shap returns one (n, S) array per class, newer a single (n, S, C) array
+    shap_vals = np.stack(shap_vals, axis=-1) if isinstance(shap_vals, list) else shap_vals
+    col = {c: i for i, c in enumerate(model.classes_)}
+
+    cond_freq = np.zeros((len(classes), len(symptoms)))
+    mean_attr = np.zeros((len(classes), len(symptoms)))
+    for c in range(len(classes)):
+        rows = y == c
+        if not rows.any() or c not in col: continue
+        cond_freq[c] = present[rows].mean(axis=0)
+        mean_attr[c] = shap_vals[rows, :, col[c]].mean(axis=0)
+    return {"classes": [str(c) for c in classes], "symptoms": list(symptoms),
+            "cond_freq": cond_freq, "mean_attr": mean_attr}
+
+class SymptomRelevance:
+    """O(1) "which symptoms matter for disease X" lookups over the training-time relevance artifact."""
+
+    def __init__(self, artifact):
+        self.scores = {}   # disease -> {symptom: (cond_freq, mean_attr)}
+        self.ranked = {}   # disease -> symptoms by descending positive attribution
+        for c, disease in enumerate(artifact["classes"]):
+            per_symptom = {}
+            # symptoms_list repeats some names and the forest splits credit across the copies;
+            # SHAP is additive, so sum them (the copies share one cond_freq)
+            for s, freq, attr in zip(artifact["symptoms"], artifact["cond_freq"][c], artifact["mean_attr"][c]):
+                prev_attr = per_symptom[s][1] if s in per_symptom else 0.0
+                per_symptom[s] = (float(freq), prev_attr + float(attr))
+            self.scores[disease] = per_symptom
+            self.ranked[disease] = [s for s, (f, a) in sorted(per_symptom.items(), key=lambda kv: (-kv[1][1], -kv[1][0]))
+                                    if a > 0]
+
+    def lookup(self, disease, symptom):
+        return self.scores.get(disease, {}).get(symptom, (0.0, 0.0))
+
+    def top_symptoms(self, disease, k=5, exclude=()):
+        out = []
+        for s in self.ranked.get(disease, []):
+            if s in exclude: continue
+            out.append(s)
+            if len(out) == k: break
+        return out
+
+    def explain(self, disease, present, k=3):
+        """Present symptoms ranked by how strongly they point to `disease` on average."""
+        attrs = self.scores.get(disease, {})
+        hits = sorted((s for s in set(present) if attrs.get(s, (0, 0))[1] > 0), key=lambda s: -attrs[s][1])
+        return hits[:k]
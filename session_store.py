@@ -0,0 +1,221 @@
+import os
+import json
+import time
+import hashlib
+import sqlite3
+import logging
+import threading
+import uuid
+
+SESSION_DB = os.environ.get("BIOPREDICT_SESSION_DB", "sessions.db")
+CHAT_LOG_CAP = 20          # messages kept in memory per session; older ones are spilled to the DB
+IDLE_TIMEOUT = 15 * 60     # seconds before an idle session is persisted and evicted
+SWEEP_INTERVAL = 60        # seconds between background eviction sweeps
+RETENTION = float(os.environ.get("BIOPREDICT_SESSION_RETENTION", 24 * 3600))  # seconds stored rows outlive their last write
+
+# Keys evicted from an idle session; profile_id, consult_id and the language selection stay behind as a stub
+PERSISTED_KEYS = ["step", "bio_data", "biomarkers", "vision_data", "probing_count",
+                  "probing_questions", "chat_log", "chat_spilled"]
+
+# --- SYMPTOM BITMASK ---
+class SymptomCodec:
+    """Encodes a symptom set as an int bitmask over the model's feature spec (symptoms_list)."""
+
+    def __init__(self, symptoms_list):
+        self.symptoms = list(symptoms_list)
+        self.spec_id = hashlib.sha1("\n".join(self.symptoms).encode()).hexdigest()[:12]
+        self.bits = {}
+        # symptoms_list has duplicate entries; a name owns every column it appears in
+        for i, s in enumerate(self.symptoms):
+            self.bits[s] = self.bits.get(s, 0) | (1 << i)
+
+    def encode(self, names):
+        mask = 0
+        for n in names:
+            mask |= self.bits.get(n, 0)
+        return mask
+
+    def decode(self, mask):
+        return list(dict.fromkeys(s for i, s in enumerate(self.symptoms) if mask >> i & 1))
+
+_CODECS = {}
+
+def codec_for(symptoms_list):
+    codec = SymptomCodec(symptoms_list)
+    return _CODECS.setdefault(codec.spec_id, codec)
+
+def codec_by_id(spec_id):
+    return _CODECS.get(spec_id)
+
+# --- SERVER-SIDE STORE ---
+def new_consult_id():
+    return uuid.uuid4().hex
+
+class SessionStore:
+    """SQLite-backed spill area for chat history and evicted session state.
+
+    Rows are keyed by consult_id, one per consultation in one browser session,
+    never by profile_id: profiles are reused across visits and tabs. Callers
+    discard() a consultation when it ends; purge() drops anything not written
+    for `retention` seconds, so chat and biomarker data don't outlive it.
+    """
+
+    def __init__(self, path=SESSION_DB, retention=RETENTION):
+        self.retention = retention
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            # Superseded profile-keyed tables; they mixed consultations and were never cleaned up
+            self._conn.execute("DROP TABLE IF EXISTS chat_archive")
+            self._conn.execute("DROP TABLE IF EXISTS session_state")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS consult_chat ("
+                               "consult_id TEXT, seq INTEGER, role TEXT, content TEXT, updated REAL, "
+                               "PRIMARY KEY (consult_id, seq))")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS consult_state ("
+                               "consult_id TEXT PRIMARY KEY, payload TEXT, updated REAL)")
+
+    def spill_chat(self, consult_id, messages, start_seq):
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO consult_chat VALUES (?, ?, ?, ?, ?)",
+                                   [(consult_id, start_seq + i, m["role"], m["content"], now)
+                                    for i, m in enumerate(messages)])
+
+    def load_chat(self, consult_id):
+        with self._lock:
+            rows = self._conn.execute("SELECT role, content FROM consult_chat WHERE consult_id = ? "
+                                      "ORDER BY seq", (consult_id,)).fetchall()
+        return [{"role": r, "content": c} for r, c in rows]
+
+    def save_state(self, consult_id, payload):
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO consult_state VALUES (?, ?, ?)",
+                               (consult_id, json.dumps(payload, default=str), time.time()))
+
+    def load_state(self, consult_id):
+        with self._lock:
+            row = self._conn.execute("SELECT payload FROM consult_state WHERE consult_id = ?",
+                                     (consult_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def discard(self, consult_id):
+        """Deletes everything stored for a finished consultation."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM consult_chat WHERE consult_id = ?", (consult_id,))
+            self._conn.execute("DELETE FROM consult_state WHERE consult_id = ?", (consult_id,))
+
+    def purge(self, now=None):
+        """Applies the retention policy; returns the number of rows deleted."""
+        cutoff = (now or time.time()) - self.retention
+        with self._lock, self._conn:
+            chats = self._conn.execute("DELETE FROM consult_chat WHERE updated < ?", (cutoff,)).rowcount
+            states = self._conn.execute("DELETE FROM consult_state WHERE updated < ?", (cutoff,)).rowcount
+        return chats + states
+
+def compact_chat_log(store, consult_id, chat_log, spilled, cap=CHAT_LOG_CAP):
+    """Spills everything but the last `cap` messages; returns (in-memory tail, total spilled)."""
+    if consult_id is None or len(chat_log) <= cap: return chat_log, spilled
+    overflow = len(chat_log) - cap
+    store.spill_chat(consult_id, chat_log[:overflow], spilled)
+    return chat_log[overflow:], spilled + overflow
+
+# --- IDLE EVICTION ---
+def snapshot(state, codec):
+    payload = {k: state[k] for k in PERSISTED_KEYS if k in state}
+    payload["symptoms"] = codec.decode(state["symptom_mask"]) if "symptom_mask" in state else []
+    return payload
+
+def restore(state, payload, codec):
+    for k in PERSISTED_KEYS:
+        if k in payload: state[k] = payload[k]
+    state["symptom_mask"] = codec.encode(payload.get("symptoms", []))
+    state["spec_id"] = codec.spec_id
+
+class _Slot:
+    __slots__ = ("lock", "last_seen", "state", "dead")
+
+    def __init__(self, state):
+        self.lock = threading.Lock()
+        self.last_seen = time.time()
+        self.state = state
+        self.dead = False
+
+class SessionRegistry:
+    """Tracks last activity per Streamlit session and evicts idle ones to the SessionStore.
+
+    Each session owns a slot lock. Its script run claims the slot before reading
+    any state, and the sweeper thread evicts only slots it can take without
+    waiting, re-checking idleness under that lock. A run therefore either starts
+    before an eviction (and is no longer idle) or after it (and sees the stub and
+    restores); it can never lose keys mid-run. SQLite writes happen on the
+    sweeper thread, off every request path.
+    """
+
+    def __init__(self, store, idle_timeout=IDLE_TIMEOUT, sweep_interval=SWEEP_INTERVAL):
+        self.store = store
+        self.idle_timeout = idle_timeout
+        self.sweep_interval = sweep_interval
+        self._slots = {}  # session_id -> _Slot
+        self._lock = threading.Lock()
+        self._codec = None
+
+    def start(self):
+        threading.Thread(target=self._sweep_loop, name="session-sweeper", daemon=True).start()
+        return self
+
+    def claim(self, session_id, state, codec):
+        """Marks the session active; waits if the sweeper is evicting it right now."""
+        self._codec = codec
+        while True:
+            with self._lock:
+                slot = self._slots.get(session_id)
+                if slot is None:
+                    slot = self._slots[session_id] = _Slot(state)
+            with slot.lock:
+                if slot.dead: continue  # evicted while we waited; register a fresh slot
+                slot.last_seen = time.time()
+                slot.state = state
+                return
+
+    def sweep(self, now=None):
+        now = now or time.time()
+        with self._lock:
+            slots = list(self._slots.items())
+        evicted = 0
+        for sid, slot in slots:
+            # A held lock means the session is claiming right now, so it is not idle
+            if not slot.lock.acquire(blocking=False): continue
+            try:
+                if slot.dead or now - slot.last_seen <= self.idle_timeout: continue
+                evict(self.store, slot.state, self._codec)
+                slot.dead, slot.state = True, None
+                with self._lock:
+                    if self._slots.get(sid) is slot: del self._slots[sid]
+                evicted += 1
+            finally:
+                slot.lock.release()
+        return evicted
+
+    def _sweep_loop(self):
+        while True:
+            time.sleep(self.sweep_interval)
+            try:
+                self.sweep()
+                self.store.purge()
+            except Exception:
+                logging.getLogger("biopredict.sessions").exception("Session sweep failed")
+
+def evict(store, state, codec):
+    """Persists an idle session and shrinks it to a stub; callers must hold its registry slot lock."""
+    # The mask was encoded against the session's own spec, which may predate a model reload
+    codec = (codec_by_id(state["spec_id"]) if "spec_id" in state else None) or codec
+    consult_id = state["consult_id"] if "consult_id" in state else None
+    if consult_id is not None:
+        chat_log = state["chat_log"] if "chat_log" in state else []
+        spilled = state["chat_spilled"] if "chat_spilled" in state else 0
+        # Spill the overflow first so the persisted payload only carries the capped tail
+        state["chat_log"], state["chat_spilled"] = compact_chat_log(store, consult_id, chat_log, spilled)
+        store.save_state(consult_id, snapshot(state, codec))
+    for k in PERSISTED_KEYS + ["symptom_mask", "spec_id"]:
+        if k in state: del state[k]
+    state["evicted"] = consult_id is not None
@@ -0,0 +1,272 @@
+import os
+import pickle
+import unicodedata
+from collections import defaultdict
+
+INDEX_PATH = 'models/symptom_index.pkl'
+MIN_FUZZY_WORD = 7       # a lone word must be at least this long to be fuzzy-matched
+MIN_GRAM_OVERLAP = 0.5   # share of trigrams a fuzzy match must have in common with the phrase
+
+# Real words one edit away from a single-word symptom ("floating" vs "bloating"); never fuzzy-matched
+COMMON_WORDS = {
+    "floating", "gloating", "swearing", "seating", "sneering", "wheeling", "cruising",
+    "etching", "pitching", "ditching", "hitching", "witching", "scurrying", "spurring", "slurring",
+}
+
+# --- NATIVE SYNONYM LISTS ---
+# Paraphrases and common misspellings mapped onto canonical SYMPTOMS_LIST entries.
+# Machine-translated entries for every LANG_MAP language are added by the offline build.
+SYNONYMS = {
+    "en": {
+        "vomiting": ["throwing up", "puking", "vomitting", "vomting"],
+        "belly pain": ["stomach ache", "tummy ache", "stomach pain"],
+        "breathing difficulty": ["shortness of breath", "short of breath", "breathlessness", "cant breathe"],
+        "diarrhea": ["diarrhoea", "diarhea", "loose motions", "loose stools"],
+        "fatigue": ["tiredness", "fatige", "exhaustion", "feeling tired"],
+        "fever": ["feverish"],
+        "headache": ["head ache", "headach", "head pain", "migraine pain"],
+        "itching": ["itchy skin", "itchiness"],
+        "dizziness": ["giddiness", "dizzyness", "lightheaded", "light headed"],
+        "runny nose": ["running nose", "nose running"],
+        "sore throat": ["throat pain", "scratchy throat"],
+        "nausea": ["queasy", "nausia", "feeling sick"],
+        "persistent cough": ["constant cough", "cough that wont go away"],
+        "fast heartbeat": ["palpitations", "racing heart"],
+        "joint pain": ["aching joints"],
+    },
+    "hi": {
+        "fever": ["बुखार", "ज्वर"],
+        "headache": ["सिरदर्द", "सिर दर्द", "सिर में दर्द"],
+        "cough": ["खांसी", "खाँसी"],
+        "vomiting": ["उल्टी"],
+        "diarrhea": ["दस्त"],
+        "fatigue": ["थकान", "कमजोरी"],
+        "dizziness": ["चक्कर"],
+        "nausea": ["जी मिचलाना", "मतली"],
+        "belly pain": ["पेट दर्द", "पेट में दर्द"],
+        "breathing difficulty": ["सांस लेने में तकलीफ", "सांस फूलना"],
+        "chest pain": ["सीने में दर्द"],
+        "itching": ["खुजली"],
+        "joint pain": ["जोड़ों का दर्द", "जोड़ों में दर्द"],
+        "sore throat": ["गले में खराश", "गले में दर्द"],
+        "sneezing": ["छींक", "छींकें"],
+        "runny nose": ["नाक बहना", "बहती नाक"],
+    },
+    "ta": {
+        "fever": ["காய்ச்சல்"],
+        "headache": ["தலைவலி", "தலை வலி"],
+        "cough": ["இருமல்"],
+        "vomiting": ["வாந்தி"],
+        "diarrhea": ["வயிற்றுப்போக்கு"],
+        "fatigue": ["சோர்வு"],
+        "dizziness": ["தலைச்சுற்றல்"],
+        "nausea": ["குமட்டல்"],
+        "belly pain": ["வயிற்று வலி"],
+        "breathing difficulty": ["மூச்சுத் திணறல்", "மூச்சு திணறல்"],
+        "chest pain": ["நெஞ்சு வலி"],
+        "itching": ["அரிப்பு"],
+        "joint pain": ["மூட்டு வலி"],
+        "sore throat": ["தொண்டை வலி"],
+        "sneezing": ["தும்மல்"],
+    },
+}
+
+def _fold_char(ch):
+    cat = unicodedata.category(ch)
+    if cat == 'Cf': return ''  # ZWJ/ZWNJ only steer rendering
+    # Punctuation, symbols and separators split tokens; combining marks (matras, viramas) must stay
+    return ' ' if cat[0] in 'PSZ' or cat == 'Cc' else ch
+
+def normalize(text):
+    """Lowercases, applies NFC and collapses punctuation/whitespace so every script indexes uniformly."""
+    text = unicodedata.normalize('NFC', text.lower())
+    return ' '.join(''.join(_fold_char(ch) for ch in text).split())
+
+def trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def max_edits(length):
+    # Per-token budget; short words only tolerate an "s"/"ing" ending ("fever" vs "fewer")
+    if length < 6: return 0
+    if length <= 10: return 1
+    return 2
+
+def bounded_levenshtein(a, b, limit):
+    """Edit distance between a and b, or limit + 1 as soon as it is known to exceed limit."""
+    if abs(len(a) - len(b)) > limit: return limit + 1
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i] + [0] * len(b)
+        row_min = i
+        for j, cb in enumerate(b, 1):
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb))
+            row_min = min(row_min, cur[j])
+        if row_min > limit: return limit + 1
+        prev = cur
+    return prev[-1]
+
+class SymptomIndex:
+    """Typo-tolerant phrase index for one language.
+
+    Exact phrases resolve through a hash lookup; everything else goes through a
+    trigram posting list, so only phrases sharing trigrams with the query are
+    ever compared with edit distance.
+
+    Fuzzy matches are anchored: a multi-word phrase may differ in one token,
+    and only if all its other tokens match exactly. A lone word is only
+    fuzzy-matched from MIN_FUZZY_WORD characters on and never if it is in
+    COMMON_WORDS, since short one-edit neighbours are usually real words.
+    """
+
+    def __init__(self, lang):
+        self.lang = lang
+        self.phrases = []   # normalized phrase text
+        self.tokens = []    # phrase text split into tokens
+        self.targets = []   # canonical symptom for each phrase
+        self.gram_counts = []  # distinct trigrams per phrase
+        self.exact = {}     # phrase -> phrase id
+        self.postings = defaultdict(list)  # trigram -> phrase ids
+        self.span_lengths = set()
+
+    def add(self, phrase, target):
+        phrase = normalize(phrase)
+        if not phrase or phrase in self.exact: return
+        pid = len(self.phrases)
+        self.phrases.append(phrase)
+        self.tokens.append(phrase.split())
+        self.targets.append(target)
+        self.exact[phrase] = pid
+        grams = trigrams(phrase)
+        self.gram_counts.append(len(grams))
+        for g in grams:
+            self.postings[g].append(pid)
+        self.span_lengths.add(len(phrase.split()))
+
+    def match_span(self, span):
+        pid = self.exact.get(span)
+        if pid is not None: return self.targets[pid]
+        for suffix in ('s', 'ing'):  # "coughs", "coughing"
+            stem = span[:-len(suffix)]
+            if span.endswith(suffix) and stem in self.exact:
+                return self.targets[self.exact[stem]]
+        tokens = span.split()
+        if any(t in COMMON_WORDS for t in tokens): return None
+        if len(tokens) == 1 and len(span) < MIN_FUZZY_WORD: return None
+        # Budget of the longest phrase token the span could misspell ("throt" for "throat")
+        limit = max_edits(max(len(t) for t in tokens) + 2)
+        if limit == 0: return None
+
+        grams = trigrams(span)
+        hits = defaultdict(int)
+        for g in grams:
+            for pid in self.postings.get(g, ()):
+                hits[pid] += 1
+        # Each edit destroys at most 3 trigrams, which bounds the overlap a true match must keep
+        best, best_dist = None, limit + 1
+        for pid, shared in hits.items():
+            total = max(len(grams), self.gram_counts[pid])
+            if shared < total - 3 * limit or shared < MIN_GRAM_OVERLAP * total: continue
+            dist = self.anchored_distance(tokens, self.tokens[pid])
+            if dist < best_dist:
+                best, best_dist = self.targets[pid], dist
+        return best
+
+    def anchored_distance(self, tokens, phrase_tokens):
+        """Edit distance of the single differing token, or infinity unless every other token is exact."""
+        if len(tokens) != len(phrase_tokens): return float('inf')
+        diff = [(a, b) for a, b in zip(tokens, phrase_tokens) if a != b]
+        if len(diff) != 1: return float('inf')
+        a, b = diff[0]
+        limit = max_edits(len(b))
+        dist = bounded_levenshtein(a, b, limit)
+        return dist if dist <= limit else float('inf')
+
+    def extract(self, text):
+        tokens = normalize(text).split()
+        found = []
+        for n in sorted(self.span_lengths):
+            for i in range(len(tokens) - n + 1):
+                target = self.match_span(' '.join(tokens[i:i + n]))
+                if target and target not in found:
+                    found.append(target)
+        return found
+
+class MultilingualSymptomIndex:
+    """Per-language SymptomIndex set; English is always searched alongside the patient's language."""
+
+    def __init__(self, symptoms):
+        self.symptoms = list(symptoms)
+        self.indexes = {}
+
+    def get(self, lang):
+        if lang not in self.indexes:
+            self.indexes[lang] = SymptomIndex(lang)
+        return self.indexes[lang]
+
+    def add_synonyms(self, lang, synonyms):
+        idx = self.get(lang)
+        for target, phrases in synonyms.items():
+            if target not in self.symptoms: continue
+            for phrase in phrases:
+                idx.add(phrase, target)
+
+    def extract(self, text, lang="en"):
+        found = self.indexes["en"].extract(text)
+        if lang != "en" and lang in self.indexes:
+            found += [s for s in self.indexes[lang].extract(text) if s not in found]
+        return found
+
+def build_base_index(symptoms):
+    """English canonical phrases plus the hand-curated synonym lists; needs no network."""
+    index = MultilingualSymptomIndex(symptoms)
+    en = index.get("en")
+    for s in symptoms:
+        en.add(s, s)
+    for lang, synonyms in SYNONYMS.items():
+        index.add_synonyms(lang, synonyms)
+    return index
+
+def build_symptom_index(symptoms, lang_codes, translate=None):
+    """Offline build: machine-translates every canonical symptom once per language."""
+    index = build_base_index(symptoms)
+    if translate is None: return index
+    for lang in lang_codes:
+        if lang == "en": continue
+        idx = index.get(lang)
+        for s in dict.fromkeys(symptoms):
+            try: phrase = translate(s, lang)
+            except Exception: continue
+            if phrase and normalize(phrase) != normalize(s):
+                idx.add(phrase, s)
+        print(f"[{lang}] {len(idx.phrases)} phrases indexed")
+    return index
+
+def save_symptom_index(index, path=INDEX_PATH):
+    with open(path, 'wb') as f: pickle.dump(index, f)
+
+def load_symptom_index(symptoms, path=INDEX_PATH):
+    """Offline-built index if it exists and matches `symptoms`, else the curated base index."""
+    if os.path.exists(path):
+        try:
+            with open(path, 'rb') as f: index = pickle.load(f)
+            if index.symptoms == list(symptoms): return index
+        except Exception as e:
+            # A stale or corrupt build must not take the app down; the base index needs no network
+            print(f"Ignoring unreadable symptom index {path}: {e}")
+    return build_base_index(symptoms)
+
+if __name__ == "__main__":
+    from deep_translator import GoogleTranslator
+    from localization import LANG_MAP
+    # Re-import so the index pickles as symptom_index.*, not __main__.*, and loads from the app
+    from symptom_index import INDEX_PATH, build_symptom_index, save_symptom_index
+
+    with open('models/symptoms_list.pkl', 'rb') as f: slist = pickle.load(f)
+
+    def google_translate(text, lang):
+        return GoogleTranslator(source='en', target=lang).translate(text)
+
+    index = build_symptom_index(slist, LANG_MAP.values(), google_translate)
+    save_symptom_index(index)
+    print(f"Saved symptom index for {len(index.indexes)} languages to {INDEX_PATH}")
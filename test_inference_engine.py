@@ -0,0 +1,42 @@
+import numpy as np
+
+from inference_engine import HISTORY_BOOST, adjust_posteriors, boost_vector, build_class_index, top_k
+
+CLASSES = ["Flu", "Migraine", "Psoriasis", "Typhoid", "Dengue"]
+
+def legacy_rescore(probs, history, boosts, k=3):
+    # Pre-vectorization unified_inference: per-class list lookups, renormalize, full argsort
+    probs = probs.copy()
+    for h in history:
+        if h in CLASSES: probs[CLASSES.index(h)] *= HISTORY_BOOST
+    for disease, b in boosts.items():
+        if disease in CLASSES: probs[CLASSES.index(disease)] *= b
+    probs = probs / np.sum(probs)
+    top = np.argsort(probs)[-k:][::-1]
+    return top, probs[top]
+
+def test_matches_legacy_rescoring():
+    rng = np.random.default_rng(0)
+    class_index = build_class_index(CLASSES)
+    history, boosts = ["Typhoid"], {"Dengue": 1.8, "Flu": 0.5, "Unknown": 3.0}
+    boost = boost_vector(class_index, {"history": history}, boosts)
+    probs = rng.dirichlet(np.ones(len(CLASSES)), size=50)
+    idx, vals = top_k(adjust_posteriors(probs, boost), k=3)
+    for row, (i, v) in enumerate(zip(idx, vals)):
+        legacy_idx, legacy_vals = legacy_rescore(probs[row], history, boosts)
+        np.testing.assert_array_equal(i, legacy_idx)
+        np.testing.assert_allclose(v, legacy_vals)
+
+def test_all_zero_row_stays_finite():
+    probs = np.array([[0.0, 0.0, 0.0], [0.2, 0.3, 0.5]])
+    adjusted = adjust_posteriors(probs, np.array([1.0, 2.0, 1.0]))
+    # The legacy path divided by zero here and ranked NaNs
+    np.testing.assert_array_equal(adjusted[0], [0.0, 0.0, 0.0])
+    np.testing.assert_allclose(adjusted[1], [0.2, 0.6, 0.5] / np.float64(1.3))
+
+def test_k_larger_than_classes():
+    probs = np.array([[0.1, 0.7, 0.2]])
+    idx, vals = top_k(probs, k=5)
+    legacy_idx = np.argsort(probs[0])[-5:][::-1]
+    np.testing.assert_array_equal(idx[0], legacy_idx)
+    np.testing.assert_allclose(vals[0], [0.7, 0.2, 0.1])
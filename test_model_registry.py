@@ -0,0 +1,37 @@
+import json
+import os
+from types import SimpleNamespace
+
+import numpy as np
+from sklearn.dummy import DummyClassifier
+
+from inference_engine import build_class_index
+from model_registry import CANDIDATE, CURRENT, SHADOW_STATS, ShadowEvaluator, prune_versions, set_pointer
+
+def make_versions(root, names):
+    for n in names:
+        os.makedirs(root / n)
+
+def test_prune_keeps_newest_and_pinned(tmp_path):
+    versions = [f"v20260101-00000{i}" for i in range(6)]
+    make_versions(tmp_path, versions + [".tmp-v20260101-000009"])
+    set_pointer(str(tmp_path), CURRENT, versions[0])
+    set_pointer(str(tmp_path), CANDIDATE, versions[5])
+    removed = prune_versions(str(tmp_path), keep=2)
+    assert removed == versions[1:4]
+    assert sorted(os.listdir(tmp_path)) == sorted([".tmp-v20260101-000009", CURRENT, CANDIDATE,
+                                                   versions[0], versions[4], versions[5]])
+
+def test_shadow_stats_are_written_per_candidate(tmp_path):
+    make_versions(tmp_path, ["v2"])
+    model = DummyClassifier(strategy="prior").fit(np.zeros((3, 2)), [0, 0, 1])
+    classes = np.array(["Flu", "Migraine"])
+    candidate = SimpleNamespace(version="v2", model=model, symptoms_list=["fever", "cough"],
+                                class_index=build_class_index(classes), le=SimpleNamespace(classes_=classes))
+    shadow = ShadowEvaluator(sample_rate=1.0, root=str(tmp_path))
+    for live_top in ("Flu", "Migraine", "Flu"):
+        shadow.maybe_submit(candidate, ["fever"], {}, {}, live_top, 0.01)
+    shadow._pool.shutdown(wait=True)
+    with open(tmp_path / "v2" / SHADOW_STATS) as f: stats = json.load(f)
+    assert (stats["calls"], stats["agreements"]) == (3, 2)
+    assert shadow.stats("v2")["calls"] == 3
@@ -0,0 +1,21 @@
+from session_store import SessionStore, compact_chat_log
+
+def chat(n, tag):
+    return [{"role": "user", "content": f"{tag} {i}"} for i in range(n)]
+
+def test_consultations_do_not_share_archive(tmp_path):
+    store = SessionStore(str(tmp_path / "sessions.db"))
+    # Same profile, two consultations: the second spills fewer messages than the first
+    compact_chat_log(store, "first", chat(30, "old"), 0, cap=5)
+    compact_chat_log(store, "second", chat(8, "new"), 0, cap=5)
+    assert [m["content"] for m in store.load_chat("second")] == ["new 0", "new 1", "new 2"]
+    store.discard("first")
+    assert store.load_chat("first") == []
+
+def test_purge_drops_rows_past_retention(tmp_path):
+    store = SessionStore(str(tmp_path / "sessions.db"), retention=60)
+    compact_chat_log(store, "c1", chat(10, "msg"), 0, cap=5)
+    store.save_state("c1", {"step": 2})
+    assert store.purge() == 0
+    assert store.purge(now=10 ** 12) == 6
+    assert store.load_chat("c1") == [] and store.load_state("c1") is None
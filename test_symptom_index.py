@@ -0,0 +1,45 @@
+from symptom_index import build_base_index, load_symptom_index, normalize, save_symptom_index
+
+SYMPTOMS = ["fever", "headache", "cough", "chest pain", "joint pain", "belly pain",
+            "bloating", "sweating", "persistent cough", "breathing difficulty", "sore throat"]
+
+def test_normalize_keeps_combining_marks():
+    assert normalize('जोड़ों का दर्द!') == 'जोड़ों का दर्द'
+    assert normalize('காய்ச்சல்,') == 'காய்ச்சல்'
+
+def test_curated_hindi_synonyms():
+    index = build_base_index(SYMPTOMS)
+    assert index.extract('मेरे सिर में दर्द है', 'hi') == ['headache']
+    assert index.extract('मुझे बुखार और खांसी है', 'hi') == ['fever', 'cough']
+    assert index.extract('जोड़ों का दर्द', 'hi') == ['joint pain']
+
+def test_curated_tamil_synonyms():
+    index = build_base_index(SYMPTOMS)
+    assert index.extract('எனக்கு காய்ச்சல் மற்றும் இருமல்', 'ta') == ['fever', 'cough']
+    assert index.extract('நெஞ்சு வலி', 'ta') == ['chest pain']
+
+def test_fuzzy_match_is_anchored():
+    index = build_base_index(SYMPTOMS)
+    assert index.extract('I feel like floating and swearing') == []
+    found = index.extract('persistant cough and breathing dificulty')
+    assert {'persistent cough', 'breathing difficulty'} <= set(found)
+    assert index.extract('sore throt') == ['sore throat']
+
+def test_fuzzy_single_words():
+    index = build_base_index(SYMPTOMS)
+    assert index.extract('I have a hedache and coughing') == ['headache', 'cough']
+    assert index.extract('I had a temperature of 98, normal') == []
+
+def test_saved_index_round_trips(tmp_path):
+    path = tmp_path / 'symptom_index.pkl'
+    save_symptom_index(build_base_index(SYMPTOMS), path)
+    index = load_symptom_index(SYMPTOMS, path)
+    assert type(index).__module__ == 'symptom_index'
+    assert index.extract('मुझे बुखार है', 'hi') == ['fever']
+
+def test_unreadable_index_falls_back_to_base(tmp_path):
+    path = tmp_path / 'symptom_index.pkl'
+    # What a build run as __main__ used to write: unloadable from the symptom_index module
+    path.write_bytes(b'c__main__\nMultilingualSymptomIndex\n)\x81.')
+    index = load_symptom_index(SYMPTOMS, path)
+    assert index.extract('fever and headache') == ['fever', 'headache']
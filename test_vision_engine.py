@@ -0,0 +1,55 @@
+import cv2
+import numpy as np
+import pytest
+
+from vision_engine import MAX_SIDE, RASH_THRESHOLD, VisionEngine, analyze_frame, decode_frame
+
+INFLAMED = (80, 80, 205)  # BGR, well past REDNESS_DELTA in Lab a* against the skin tone below
+
+def synthetic_frame(spots=(), skin=(120, 150, 200), width=1280, height=720):
+    # Like bench_vision.synthetic_frame, but with fixed (x, y, radius) spots
+    rng = np.random.default_rng(0)
+    img = np.full((height, width, 3), skin, np.uint8)
+    img = cv2.add(img, rng.integers(0, 12, img.shape, dtype=np.uint8))
+    for x, y, r in spots:
+        cv2.circle(img, (x, y), r, INFLAMED, -1)
+    return cv2.imencode('.jpg', img)[1].tobytes()
+
+def grid(n, radius):
+    return [(240 + 120 * (i % 7), 180 + 90 * (i // 7), radius) for i in range(n)]
+
+def test_decode_frame_downscales():
+    assert max(decode_frame(synthetic_frame()).shape[:2]) == MAX_SIDE
+    with pytest.raises(ValueError):
+        decode_frame(b"not an image")
+
+def test_clear_skin_is_not_flagged():
+    result = analyze_frame(synthetic_frame())
+    assert result["symptoms"] == [] and result["skin_fraction"] > 0.9
+
+def test_few_small_spots_stay_below_rash_threshold():
+    result = analyze_frame(synthetic_frame(grid(8, 12)))
+    assert 0 < result["redness"] < RASH_THRESHOLD
+    assert result["symptoms"] == []
+
+def test_many_spots_flag_rash_and_red_spots():
+    result = analyze_frame(synthetic_frame(grid(35, 30)))
+    assert result["redness"] >= RASH_THRESHOLD
+    assert result["symptoms"] == ["skin rash", "red spots"]
+
+def test_one_large_patch_is_a_rash_without_spots():
+    result = analyze_frame(synthetic_frame([(640, 360, 150)]))
+    assert result["symptoms"] == ["skin rash"]
+
+def test_no_skin_region():
+    result = analyze_frame(synthetic_frame(skin=(200, 120, 60)))
+    assert result["label"] == "No skin region detected"
+
+def test_engine_resubmits_evicted_frames():
+    engine = VisionEngine(cache_size=1)
+    first, second = synthetic_frame(), synthetic_frame(grid(35, 30))
+    key = engine.submit(first)
+    assert engine.submit(first) == key
+    engine.submit(second)
+    assert engine.result(key, timeout=0) is None  # evicted
+    assert engine.result(engine.submit(first), timeout=5)["symptoms"] == []
@@ -3,9 +3,12 @@ import numpy as np
 import re
 import pickle
 import os
+import sys
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.preprocessing import LabelEncoder
 from sklearn.model_selection import train_test_split
+from model_registry import publish_version, CURRENT, CANDIDATE
+from relevance_index import build_relevance
 
 # Expanded and refined symptoms list
 SYMPTOMS_LIST = [
@@ -48,7 +51,7 @@ def preprocess_text(text):
         symptom_vector.append(val)
     return symptom_vector
 
-def train_model():
+def train_model(candidate=False):
     print("Loading dataset...")
     df = pd.read_csv('Symptom2Disease.csv')
     
@@ -86,23 +89,38 @@ def train_model():
     accuracy = model.score(X_test, y_test)
     print(f"Model Accuracy: {accuracy * 100:.2f}%")
     
-    print("Saving files to /models...")
-    if not os.path.exists('models'):
-        os.makedirs('models')
+    print("Computing per-disease symptom relevance...")
+    relevance = build_relevance(model, X_train, y_train, le.classes_, SYMPTOMS_LIST)
+    
+    # The flat layout is the live fallback before any CURRENT pointer exists,
+    # so a shadow-only candidate run must never overwrite it
+    if not candidate:
+        print("Saving files to /models...")
+        if not os.path.exists('models'):
+            os.makedirs('models')
+        
+        with open('models/model.pkl', 'wb') as f:
+            pickle.dump(model, f)
         
-    with open('models/model.pkl', 'wb') as f:
-        pickle.dump(model, f)
+        with open('models/label_encoder.pkl', 'wb') as f:
+            pickle.dump(le, f)
         
-    with open('models/label_encoder.pkl', 'wb') as f:
-        pickle.dump(le, f)
+        with open('models/symptoms_list.pkl', 'wb') as f:
+            pickle.dump(SYMPTOMS_LIST, f)
         
-    with open('models/symptoms_list.pkl', 'wb') as f:
-        pickle.dump(SYMPTOMS_LIST, f)
+        with open('models/X_train.pkl', 'wb') as f:
+            pickle.dump(X_train, f)
         
-    with open('models/X_train.pkl', 'wb') as f:
-        pickle.dump(X_train, f)
+        with open('models/relevance.pkl', 'wb') as f:
+            pickle.dump(relevance, f)
+    
+    # Versioned copy the running app hot-reloads; --candidate only shadow-evaluates it
+    pointer = CANDIDATE if candidate else CURRENT
+    version = publish_version({"model": model, "label_encoder": le, "symptoms_list": SYMPTOMS_LIST,
+                               "relevance": relevance}, pointer=pointer)
+    print(f"Published {version} as {pointer}.")
         
     print("Training complete.")
 
 if __name__ == "__main__":
-    train_model()
+    train_model(candidate="--candidate" in sys.argv)
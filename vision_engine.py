@@ -0,0 +1,91 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+import cv2
+import numpy as np
+
+MAX_SIDE = 320           # analysis resolution; camera frames are downscaled before any per-pixel work
+CACHE_SIZE = 256         # analysed frames kept by image hash
+MIN_SKIN_FRACTION = 0.05
+REDNESS_DELTA = 18       # Lab a* above the frame's median skin tone that counts as inflamed
+RASH_THRESHOLD = 0.06    # inflamed share of skin pixels that flags a rash
+SPOT_MAX_AREA = 0.004    # inflamed blobs smaller than this share of the frame count as spots
+
+def decode_frame(image_bytes, max_side=MAX_SIDE):
+    """Decodes and downscales a camera frame; JPEG is decoded at half resolution directly."""
+    img = cv2.imdecode(np.frombuffer(image_bytes, np.uint8), cv2.IMREAD_REDUCED_COLOR_2)
+    if img is None: raise ValueError("Unreadable image")
+    h, w = img.shape[:2]
+    scale = max_side / max(h, w)
+    if scale < 1:
+        img = cv2.resize(img, (max(1, round(w * scale)), max(1, round(h * scale))), interpolation=cv2.INTER_AREA)
+    return img
+
+def skin_mask(img):
+    ycrcb = cv2.cvtColor(img, cv2.COLOR_BGR2YCrCb)
+    mask = cv2.inRange(ycrcb, (0, 133, 77), (255, 173, 127))
+    mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, np.ones((3, 3), np.uint8))
+    # Strongly inflamed patches fall outside the skin chroma range; fill holes enclosed by skin
+    contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    return cv2.drawContours(mask, contours, -1, 255, thickness=cv2.FILLED)
+
+def analyze_redness(img, mask):
+    """Default stage: share of skin pixels markedly redder than the patient's own skin tone."""
+    skin = mask > 0
+    skin_fraction = float(skin.mean())
+    if skin_fraction < MIN_SKIN_FRACTION:
+        return {"label": "No skin region detected", "symptoms": [], "skin_fraction": skin_fraction, "redness": 0.0}
+
+    a_star = cv2.cvtColor(img, cv2.COLOR_BGR2LAB)[:, :, 1]
+    inflamed = (a_star > np.median(a_star[skin]) + REDNESS_DELTA) & skin
+    redness = float(inflamed.sum() / skin.sum())
+    symptoms = []
+    if redness >= RASH_THRESHOLD:
+        symptoms.append("skin rash")
+        _, _, stats, _ = cv2.connectedComponentsWithStats(inflamed.astype(np.uint8))
+        spots = np.count_nonzero(stats[1:, cv2.CC_STAT_AREA] < SPOT_MAX_AREA * inflamed.size)
+        if spots >= 3: symptoms.append("red spots")
+    label = "Localized Rash Detected" if symptoms else "No visible inflammation"
+    return {"label": label, "symptoms": symptoms, "skin_fraction": skin_fraction, "redness": redness}
+
+def analyze_frame(image_bytes, classifier=analyze_redness):
+    img = decode_frame(image_bytes)
+    return classifier(img, skin_mask(img))
+
+class VisionEngine:
+    """Runs frame analysis on a worker pool and caches results by image hash.
+
+    `classifier(img, skin_mask) -> {"label", "symptoms", ...}` is pluggable; the
+    default is the redness heuristic above. submit() is idempotent, so Streamlit
+    reruns with the same camera frame reuse the in-flight or finished result.
+    """
+
+    def __init__(self, classifier=analyze_redness, workers=2, cache_size=CACHE_SIZE):
+        self.classifier = classifier
+        self.cache_size = cache_size
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="vision")
+        self._cache = OrderedDict()  # image hash -> Future
+        self._lock = threading.Lock()
+
+    def submit(self, image_bytes):
+        key = hashlib.sha256(image_bytes).hexdigest()
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return key
+            self._cache[key] = self._pool.submit(analyze_frame, image_bytes, self.classifier)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return key
+
+    def result(self, key, timeout=None):
+        """Analysis for `key`, or None if it is still running (or was evicted) after `timeout`."""
+        with self._lock:
+            future = self._cache.get(key)
+        if future is None: return None
+        try: return future.result(timeout=timeout)
+        except TimeoutError: return None
+        except Exception as e:
+            return {"label": f"Vision error: {e}", "symptoms": [], "skin_fraction": 0.0, "redness": 0.0}